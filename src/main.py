@@ -2,10 +2,13 @@ import argparse
 from datetime import datetime
 import sys
 import logging
-from typing import Optional, Tuple
-from scrapers.rss import RSSScaper
-from utils.date_utils import DateUtils
-from utils.output import OutputManager
+from typing import Optional, Tuple, TYPE_CHECKING
+
+# スクレイパーや出力処理は requests / bs4 / dateutil などの重いライブラリを読み込むため、
+# 実際にコマンドを実行するときまでインポートを遅らせる
+if TYPE_CHECKING:
+    from scrapers.rss import RSSScaper
+    from utils.date_utils import DateUtils
 
 def setup_logging():
     """ロギングの設定"""
@@ -16,7 +19,7 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
-def parse_date(date_str: Optional[str], date_utils: DateUtils) -> Optional[datetime]:
+def parse_date(date_str: Optional[str], date_utils: 'DateUtils') -> Optional[datetime]:
     """
     日付文字列をパース
     
@@ -36,7 +39,7 @@ def parse_date(date_str: Optional[str], date_utils: DateUtils) -> Optional[datet
     return date
 
 def validate_dates(start_date: Optional[str], end_date: Optional[str],
-                  date_utils: DateUtils) -> Tuple[Optional[datetime], Optional[datetime]]:
+                  date_utils: 'DateUtils') -> Tuple[Optional[datetime], Optional[datetime]]:
     """
     日付の妥当性を検証
     
@@ -59,16 +62,19 @@ def validate_dates(start_date: Optional[str], end_date: Optional[str],
         
     return parsed_start, parsed_end
 
-def search_news(args: argparse.Namespace, logger: logging.Logger):
+def search_news(args: argparse.Namespace, logger: logging.Logger,
+                scraper: 'RSSScaper', date_utils: 'DateUtils'):
     """
     ニュース記事の検索を実行
     
     Args:
         args (argparse.Namespace): コマンドライン引数
         logger (logging.Logger): ロガー
+        scraper (RSSScaper): スクレイパー
+        date_utils (DateUtils): 日付ユーティリティ
     """
-    date_utils = DateUtils()
-    scraper = RSSScaper()
+    from utils.output import OutputManager
+
     output_manager = OutputManager()
     
     try:
@@ -89,15 +95,15 @@ def search_news(args: argparse.Namespace, logger: logging.Logger):
         logger.error(f"検索処理中にエラーが発生しました: {e}")
         sys.exit(1)
 
-def add_site(args: argparse.Namespace, logger: logging.Logger):
+def add_site(args: argparse.Namespace, logger: logging.Logger, scraper: 'RSSScaper'):
     """
     サイトを追加
     
     Args:
         args (argparse.Namespace): コマンドライン引数
         logger (logging.Logger): ロガー
+        scraper (RSSScaper): スクレイパー
     """
-    scraper = RSSScaper()
     try:
         if scraper.add_site(args.name, args.url):
             logger.info(f"サイトを追加しました: {args.name}")
@@ -108,15 +114,15 @@ def add_site(args: argparse.Namespace, logger: logging.Logger):
         logger.error(f"サイト追加中にエラーが発生しました: {e}")
         sys.exit(1)
 
-def delete_site(args: argparse.Namespace, logger: logging.Logger):
+def delete_site(args: argparse.Namespace, logger: logging.Logger, scraper: 'RSSScaper'):
     """
     サイトを削除
     
     Args:
         args (argparse.Namespace): コマンドライン引数
         logger (logging.Logger): ロガー
+        scraper (RSSScaper): スクレイパー
     """
-    scraper = RSSScaper()
     try:
         if scraper.delete_site(args.name, args.url):
             logger.info(f"サイトを削除しました: {args.name}")
@@ -127,29 +133,44 @@ def delete_site(args: argparse.Namespace, logger: logging.Logger):
         logger.error(f"サイト削除中にエラーが発生しました: {e}")
         sys.exit(1)
 
-def main():
-    """メイン処理"""
-    logger = setup_logging()
-    
-    # コマンドライン引数の解析
-    parser = argparse.ArgumentParser(description='ニュース記事スクレイピングツール')
-    subparsers = parser.add_subparsers(dest='command', help='実行する機能')
-    
-    # 検索コマンド
+def build_search_parser(subparsers: argparse._SubParsersAction):
+    """検索コマンドのサブパーサーを構築"""
     search_parser = subparsers.add_parser('search', help='ニュース記事を検索')
     search_parser.add_argument('keyword', help='検索キーワード')
     search_parser.add_argument('--start-date', help='検索開始日 (YYYY-MM-DD)')
     search_parser.add_argument('--end-date', help='検索終了日 (YYYY-MM-DD)')
-    
-    # サイト追加コマンド
+
+def build_add_parser(subparsers: argparse._SubParsersAction):
+    """サイト追加コマンドのサブパーサーを構築"""
     add_parser = subparsers.add_parser('add', help='サイトを追加')
     add_parser.add_argument('name', help='サイト名')
     add_parser.add_argument('url', help='サイトのURL')
-    
-    # サイト削除コマンド
+
+def build_del_parser(subparsers: argparse._SubParsersAction):
+    """サイト削除コマンドのサブパーサーを構築"""
     del_parser = subparsers.add_parser('del', help='サイトを削除')
     del_parser.add_argument('name', help='サイト名')
     del_parser.add_argument('url', help='サイトのURL')
+
+SUBPARSER_BUILDERS = {
+    'search': build_search_parser,
+    'add': build_add_parser,
+    'del': build_del_parser,
+}
+
+def main():
+    """メイン処理"""
+    logger = setup_logging()
+    
+    # コマンドライン引数の解析
+    parser = argparse.ArgumentParser(description='ニュース記事スクレイピングツール')
+    subparsers = parser.add_subparsers(dest='command', help='実行する機能')
+    
+    # 指定されたコマンドのサブパーサーのみ構築する（不明な場合やヘルプ表示時はすべて）
+    requested = sys.argv[1] if len(sys.argv) > 1 else None
+    commands = [requested] if requested in SUBPARSER_BUILDERS else list(SUBPARSER_BUILDERS)
+    for command in commands:
+        SUBPARSER_BUILDERS[command](subparsers)
     
     args = parser.parse_args()
     
@@ -157,13 +178,17 @@ def main():
         parser.print_help()
         sys.exit(1)
     
+    # スクレイパーはコマンド確定後に一度だけ生成し、各処理で共有する
+    from scrapers.rss import RSSScaper
+    scraper = RSSScaper()
+    
     # コマンドに応じた処理を実行
     if args.command == 'search':
-        search_news(args, logger)
+        search_news(args, logger, scraper, scraper.date_utils)
     elif args.command == 'add':
-        add_site(args, logger)
+        add_site(args, logger, scraper)
     elif args.command == 'del':
-        delete_site(args, logger)
+        delete_site(args, logger, scraper)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
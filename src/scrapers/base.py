@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import copy
 import logging
 import os
 import json
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:
+    # orjsonが無い環境では標準のjsonで書き込む
+    orjson = None
+
+# 設定ファイルのパス -> (更新時刻[ns], 設定内容)
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict]] = {}
+
 class BaseScraper(ABC):
     """
     スクレイパーの基本クラス
@@ -20,11 +30,12 @@ class BaseScraper(ABC):
             config_path (str): 設定ファイルのパス
         """
         self.config_path = config_path
+        self._setup_logging()
         self.config = self._load_config()
+        self._build_site_index()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
-        self._setup_logging()
 
     def _setup_logging(self):
         """ロギングの設定"""
@@ -42,6 +53,8 @@ class BaseScraper(ABC):
         """
         設定ファイルの読み込み
         
+        同一プロセス内では更新時刻が変わらない限りパース済みの設定を再利用する
+        
         Returns:
             Dict: 設定情報
         """
@@ -50,14 +63,53 @@ class BaseScraper(ABC):
                 self.logger.warning(f"設定ファイルが見つかりません: {self.config_path}")
                 return {"sites": []}
             
+            mtime = os.stat(self.config_path).st_mtime_ns
+            cached = _CONFIG_CACHE.get(self.config_path)
+            if cached and cached[0] == mtime:
+                return copy.deepcopy(cached[1])
+            
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
                 self.logger.info(f"設定を読み込みました: {len(config.get('sites', []))}サイト")
-                return config
+            
+            _CONFIG_CACHE[self.config_path] = (mtime, config)
+            return copy.deepcopy(config)
         except Exception as e:
             self.logger.error(f"設定ファイルの読み込みに失敗: {e}")
             return {"sites": []}
 
+    def _build_site_index(self):
+        """URL・サイト名からサイト設定を引くための索引を作成"""
+        sites = self.config.setdefault('sites', [])
+        self._sites_by_url = {site.get('url'): site for site in sites}
+        self._sites_by_name = {site.get('name'): site for site in sites}
+
+    def _save_config(self):
+        """
+        設定ファイルの書き込み
+        
+        一時ファイルに書き出してから置き換えることで、
+        書き込み途中で中断しても設定ファイルが壊れないようにする
+        """
+        if orjson is not None:
+            data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(self.config, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        tmp_path = f'{self.config_path}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            _CONFIG_CACHE.pop(self.config_path, None)
+
     def validate_date_range(self, start_date: Optional[datetime] = None,
                           end_date: Optional[datetime] = None) -> bool:
         """
@@ -151,22 +203,24 @@ class BaseScraper(ABC):
             if not self.validate_url(url):
                 return False
                 
-            if any(site['url'] == url for site in self.config['sites']):
+            if url in self._sites_by_url:
                 self.logger.warning(f"URLが重複しています: {url}")
                 return False
                 
-            if any(site['name'] == name for site in self.config['sites']):
+            if name in self._sites_by_name:
                 self.logger.warning(f"サイト名が重複しています: {name}")
                 return False
                 
-            self.config['sites'].append({
+            site = {
                 'name': name,
                 'url': url,
                 'enabled': True
-            })
+            }
+            self.config['sites'].append(site)
+            self._sites_by_url[url] = site
+            self._sites_by_name[name] = site
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            self._save_config()
                 
             self.logger.info(f"サイトを追加しました: {name}")
             return True
@@ -187,18 +241,16 @@ class BaseScraper(ABC):
             bool: 削除に成功した場合True
         """
         try:
-            original_count = len(self.config['sites'])
-            self.config['sites'] = [
-                site for site in self.config['sites']
-                if not (site['name'] == name and site['url'] == url)
-            ]
-            
-            if len(self.config['sites']) == original_count:
+            site = self._sites_by_url.get(url)
+            if site is None or site.get('name') != name:
                 self.logger.warning(f"指定されたサイトが見つかりません: {name}")
                 return False
                 
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            self.config['sites'] = [s for s in self.config['sites'] if s is not site]
+            del self._sites_by_url[url]
+            self._sites_by_name.pop(name, None)
+                
+            self._save_config()
                 
             self.logger.info(f"サイトを削除しました: {name}")
             return True
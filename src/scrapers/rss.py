@@ -1,15 +1,250 @@
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Pattern, Tuple, TYPE_CHECKING
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import base64
+import io
+import json
+import logging
+import os
+import re
+import threading
 import time
-from urllib3.exceptions import InsecureRequestWarning
-import urllib3
+from collections import defaultdict
+from urllib.parse import urlparse
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from .base import BaseScraper
 from ..utils.date_utils import DateUtils
 
-# SSL証明書の警告を無効化
-urllib3.disable_warnings(InsecureRequestWarning)
+# requests / aiohttp / bs4 / lxml は読み込みが重いため、実際に使用する箇所でインポートする
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+
+def _tag_matches(elem, selector: str) -> bool:
+    """
+    要素がセレクタ（'title' や 'dc:date' 形式のタグ名）に一致するか判定
+    
+    プレフィックスも一致する要素のみを対象とし、プレフィックス無しのセレクタは
+    media:title や atom:link のような別名前空間の要素には一致させない
+    （RSS 1.0/Atom のデフォルト名前空間の要素はプレフィックス無しとして一致する）
+    """
+    if not isinstance(elem.tag, str):
+        return False
+    prefix, _, local = selector.rpartition(':')
+    if elem.tag.rpartition('}')[2] != local:
+        return False
+    return elem.prefix == (prefix or None)
+
+def _find_descendant(elem, selector: str):
+    """セレクタに一致する最初の子孫要素を取得"""
+    for child in elem.iterdescendants():
+        if _tag_matches(child, selector):
+            return child
+    return None
+
+def _element_text(elem) -> str:
+    """要素のテキストを前後の空白を除いて連結"""
+    return ''.join(text.strip() for text in elem.itertext())
+
+def _parse_feed_items(content: bytes, rules: Dict, logger: logging.Logger) -> List[Dict]:
+    """
+    フィードをパース
+    
+    Args:
+        content (bytes): フィードの内容
+        rules (Dict): スクレイピングルール
+        logger (logging.Logger): ロガー
+        
+    Returns:
+        List[Dict]: パースされた記事のリスト
+    """
+    return list(_iter_feed_items(content, rules, logger))
+
+def _iter_feed_items(content: bytes, rules: Dict, logger: logging.Logger) -> Iterator[Dict]:
+    """
+    フィードを逐次パースし、記事を1件ずつ返す
+    
+    lxmlのiterparseで記事要素ごとに処理し、処理済みの要素は破棄するため
+    フィード全体のDOMを保持しない。XMLとして解釈できない場合のみ
+    BeautifulSoupにフォールバックする
+    
+    Args:
+        content (bytes): フィードの内容
+        rules (Dict): スクレイピングルール
+        logger (logging.Logger): ロガー
+        
+    Yields:
+        Dict: パースされた記事
+    """
+    if not content:
+        return
+
+    from lxml import etree
+
+    article_selector = rules.get('article_selector', 'item')
+    title_selector = rules.get('title_selector', 'title')
+    link_selector = rules.get('link_selector', 'link')
+    date_selector = rules.get('date_selector', 'pubDate')
+    # 'item' 指定時はAtomフィードの 'entry' も記事として扱う
+    article_selectors = (article_selector, 'entry') if article_selector == 'item' else (article_selector,)
+
+    found = False
+    try:
+        events = etree.iterparse(io.BytesIO(content), events=('end',), recover=True,
+                                 huge_tree=False, resolve_entities=False)
+        for _, elem in events:
+            if not any(_tag_matches(elem, selector) for selector in article_selectors):
+                continue
+            found = True
+            try:
+                title = _find_descendant(elem, title_selector)
+                link = _find_descendant(elem, link_selector)
+                date = _find_descendant(elem, date_selector)
+                
+                if title is not None and link is not None:
+                    yield {
+                        'title': _element_text(title),
+                        'link': link.get('href') or _element_text(link),
+                        'date': _element_text(date) if date is not None else ''
+                    }
+                    
+            except Exception as e:
+                logger.warning(f"記事のパース中にエラー: {e}")
+            finally:
+                # 処理済みの記事要素と、それ以前の兄弟要素を破棄する
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+                
+    except etree.XMLSyntaxError as e:
+        if found:
+            logger.error(f"フィードのパース中にエラー: {e}")
+            return
+    except Exception as e:
+        logger.error(f"フィードのパース中にエラー: {e}")
+        return
+
+    if not found:
+        yield from _parse_feed_html(content, rules, logger)
+
+def _parse_feed_html(content: bytes, rules: Dict, logger: logging.Logger) -> List[Dict]:
+    """
+    BeautifulSoupでフィードをパース（XMLとして解釈できない場合）
+    
+    Args:
+        content (bytes): フィードの内容
+        rules (Dict): スクレイピングルール
+        logger (logging.Logger): ロガー
+        
+    Returns:
+        List[Dict]: パースされた記事のリスト
+    """
+    from bs4 import BeautifulSoup
+
+    try:
+        soup = BeautifulSoup(content, 'html.parser')
+        items = []
+        
+        for item in soup.find_all(rules.get('article_selector', 'item')):
+            try:
+                title = item.find(rules.get('title_selector', 'title'))
+                link = item.find(rules.get('link_selector', 'link'))
+                date = item.find(rules.get('date_selector', 'pubDate'))
+                
+                if title and link:
+                    items.append({
+                        'title': title.get_text(strip=True),
+                        'link': link.get('href') or link.get_text(strip=True),
+                        'date': date.get_text(strip=True) if date else ''
+                    })
+                    
+            except Exception as e:
+                logger.warning(f"記事のパース中にエラー: {e}")
+                continue
+                
+        return items
+        
+    except Exception as e:
+        logger.error(f"フィードのパース中にエラー: {e}")
+        return []
+
+def _keyword_matches(text: str, keyword_pattern: Optional[Pattern[str]]) -> bool:
+    """
+    キーワードマッチング
+    
+    Args:
+        text (str): 検索対象のテキスト
+        keyword_pattern (Optional[Pattern[str]]): RSSScaper._compile_keywords で作成した正規表現
+        
+    Returns:
+        bool: キーワードが一致する場合True
+    """
+    if not text or keyword_pattern is None:
+        return False
+        
+    return keyword_pattern.search(text) is not None
+
+def _filter_items(items: Iterable[Dict], start_date: datetime, end_date: datetime,
+                  keyword_pattern: Optional[Pattern[str]], date_utils: DateUtils,
+                  logger: logging.Logger) -> List[Tuple[datetime, Dict]]:
+    """
+    記事を日付範囲とキーワードでフィルタリング
+    
+    Args:
+        items (Iterable[Dict]): パースされた記事
+        start_date (datetime): 検索開始日
+        end_date (datetime): 検索終了日
+        keyword_pattern (Optional[Pattern[str]]): キーワードの正規表現
+        date_utils (DateUtils): 日付ユーティリティ
+        logger (logging.Logger): ロガー
+        
+    Returns:
+        List[Tuple[datetime, Dict]]: 条件に一致した (掲載日時, 記事) のリスト
+    """
+    matches = []
+    for item in items:
+        try:
+            # 日付でフィルタリング（パース結果はキャッシュされるため最初に行う）
+            date_str = item.get('date')
+            if not date_str:
+                continue
+
+            article_date = date_utils.parse_date(date_str)
+            if not article_date:
+                continue
+                
+            if not (start_date <= article_date <= end_date):
+                continue
+
+            # キーワードでフィルタリング
+            if not _keyword_matches(item.get('title'), keyword_pattern):
+                continue
+
+            matches.append((article_date, item))
+            
+        except Exception as e:
+            logger.warning(f"記事の解析中にエラー: {e}")
+            continue
+    return matches
+
+def _parse_and_filter_bytes(args: Tuple[bytes, Dict, datetime, datetime, Optional[Pattern[str]]]
+                            ) -> List[Tuple[datetime, Dict]]:
+    """
+    フィードのパースとフィルタリング（ProcessPoolExecutor のワーカープロセスで実行）
+    
+    プロセス間の転送量を抑えるため、条件に一致した記事のみを返す
+    
+    Args:
+        args: (フィードの内容, スクレイピングルール, 検索開始日, 検索終了日, キーワードの正規表現)
+        
+    Returns:
+        List[Tuple[datetime, Dict]]: 条件に一致した (掲載日時, 記事) のリスト
+    """
+    content, rules, start_date, end_date, keyword_pattern = args
+    logger = logging.getLogger('RSSScaper')
+    items = _iter_feed_items(content, rules, logger)
+    return _filter_items(items, start_date, end_date, keyword_pattern, DateUtils(), logger)
 
 class RSSScaper(BaseScraper):
     """RSSフィードからニュース記事を取得するスクレイパー"""
@@ -22,8 +257,148 @@ class RSSScaper(BaseScraper):
             config_path (str): 設定ファイルのパス
         """
         super().__init__(config_path)
+        self.headers['Accept-Encoding'] = 'gzip, deflate'
+        
+        # 検索中に繰り返し参照する設定値は属性として保持する
+        settings = self.config.get('settings', {})
+        self.retry_count = settings.get('retry_count', 3)
+        self.retry_delay = settings.get('retry_delay', 2)
+        self.request_timeout = settings.get('request_timeout', 30)
+        self.max_workers = max(1, settings.get('concurrent_requests', 3))
+        self.use_async = settings.get('use_async', False)
+        self.use_process_pool = settings.get('use_process_pool', False)
+        
         self.date_utils = DateUtils()
         self.results = []
+        self.session = None
+        # 条件付きGET用のキャッシュ（URL -> ETag / Last-Modified / 本文）
+        self.feed_cache_path = os.path.join(os.path.dirname(config_path), 'feed_cache.json')
+        self._feed_cache: Optional[Dict[str, Dict]] = None
+        self._feed_cache_dirty = False
+        # ホストごとのリクエスト間隔制御（同一ホストへのリクエストは retry_delay 秒ずつ空ける）
+        self._host_next_ok: Dict[str, float] = defaultdict(float)
+        self._host_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._host_locks_guard = threading.Lock()
+
+    def _create_session(self) -> 'requests.Session':
+        """
+        コネクションプール付きのHTTPセッションを作成
+        
+        Returns:
+            requests.Session: ワーカースレッド間で共有するセッション
+        """
+        import requests
+        import urllib3
+        from requests.adapters import HTTPAdapter
+        from urllib3.exceptions import InsecureRequestWarning
+
+        # SSL証明書の警告を無効化
+        urllib3.disable_warnings(InsecureRequestWarning)
+
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _get_session(self) -> 'requests.Session':
+        """
+        HTTPセッションを取得（未作成の場合は作成）
+        
+        Returns:
+            requests.Session: HTTPセッション
+        """
+        if self.session is None:
+            self.session = self._create_session()
+        return self.session
+
+    def _get_feed_cache(self) -> Dict[str, Dict]:
+        """
+        条件付きGET用のキャッシュを取得（未読み込みの場合はファイルから読み込む）
+        
+        Returns:
+            Dict[str, Dict]: URLごとのETag / Last-Modified / 本文
+        """
+        if self._feed_cache is not None:
+            return self._feed_cache
+
+        self._feed_cache = {}
+        try:
+            if os.path.exists(self.feed_cache_path):
+                with open(self.feed_cache_path, 'r', encoding='utf-8') as f:
+                    for url, entry in json.load(f).items():
+                        entry['content'] = base64.b64decode(entry['content'])
+                        self._feed_cache[url] = entry
+        except Exception as e:
+            self.logger.warning(f"フィードキャッシュの読み込みに失敗: {e}")
+            self._feed_cache = {}
+        return self._feed_cache
+
+    def _save_feed_cache(self):
+        """条件付きGET用のキャッシュをファイルに保存"""
+        if not self._feed_cache_dirty or self._feed_cache is None:
+            return
+
+        data = {
+            url: dict(entry, content=base64.b64encode(entry['content']).decode('ascii'))
+            for url, entry in self._feed_cache.items()
+        }
+        tmp_path = f'{self.feed_cache_path}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.feed_cache_path)
+            self._feed_cache_dirty = False
+        except Exception as e:
+            self.logger.warning(f"フィードキャッシュの保存に失敗: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _wait_for_host(self, url: str):
+        """
+        同一ホストへの前回のリクエストから retry_delay 秒経過するまで待機
+        
+        別ホストへのリクエストは待たずに並行して実行される
+        
+        Args:
+            url (str): リクエスト先のURL
+        """
+        host = urlparse(url).netloc
+        with self._host_locks_guard:
+            lock = self._host_locks[host]
+        with lock:
+            wait = self._host_next_ok[host] - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._host_next_ok[host] = time.monotonic() + self.retry_delay
+
+    async def _wait_for_host_async(self, url: str):
+        """
+        _wait_for_host の非同期版
+        
+        イベントループは単一スレッドのため、待機開始前に次の実行枠を予約する
+        
+        Args:
+            url (str): リクエスト先のURL
+        """
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        start = max(now, self._host_next_ok[host])
+        self._host_next_ok[host] = start + self.retry_delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def close(self):
+        """HTTPセッションを閉じて接続を解放"""
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.close()
+            self.session = None
+
+    def __del__(self):
+        """破棄時にHTTPセッションを閉じる"""
+        self.close()
 
     def search(self, keyword: str, start_date: Optional[datetime] = None,
               end_date: Optional[datetime] = None) -> List[Dict]:
@@ -46,6 +421,10 @@ class RSSScaper(BaseScraper):
         
         total_articles = 0
         self.results = []
+        # URL -> (掲載日時, 記事)
+        results_by_url: Dict[str, Tuple[datetime, Dict]] = {}
+        # キーワードは検索ごとに一度だけ正規表現にコンパイルする
+        keyword_pattern = self._compile_keywords(keyword)
         
         # RSS対応サイトのみフィルタリング
         rss_sites = [site for site in self.config['sites'] 
@@ -53,39 +432,40 @@ class RSSScaper(BaseScraper):
         
         self.logger.info(f"検索対象RSSサイト数: {len(rss_sites)}")
         
-        for site in rss_sites:
-            try:
-                self.logger.info(f"\n{site['name']} からの記事を取得中...")
-                content = self._get_feed_content(site['url'])
-                if not content:
-                    continue
+        if self.use_process_pool:
+            # 取得はスレッド、パースとフィルタリングはプロセスで並列実行
+            site_matches = self._fetch_all_multiprocess(rss_sites, start_date, end_date, keyword_pattern)
+        else:
+            # 取得方式は設定で切り替える（use_async: true で asyncio + aiohttp）
+            if self.use_async:
+                site_feeds = asyncio.run(self._fetch_all_async(rss_sites))
+            else:
+                site_feeds = self._fetch_all_threaded(rss_sites)
+            site_matches = (
+                (site, _filter_items(items, start_date, end_date, keyword_pattern,
+                                     self.date_utils, self.logger))
+                for site, items in site_feeds
+            )
 
-                items = self._parse_feed(content, site['scraping_rules'])
+        for site, matches in site_matches:
+            try:
                 site_articles = 0
 
-                for item in items:
+                for article_date, item in matches:
                     try:
                         if not self._validate_article(item):
                             continue
 
-                        # キーワードでフィルタリング
-                        if not self._keyword_matches(item['title'], keyword):
-                            continue
-
-                        # 日付でフィルタリング
-                        article_date = self.date_utils.parse_date(item['date'])
-                        if not article_date:
-                            continue
-                            
-                        if not (start_date <= article_date <= end_date):
-                            continue
-
-                        self.results.append({
+                        record = {
                             'サイト名': site['name'],
                             '掲載日': article_date.strftime('%Y/%m/%d'),
                             'タイトル': item['title'],
                             'URL': item['link']
-                        })
+                        }
+                        # URLで重複を除去（同じURLは新しい日付を優先）
+                        existing = results_by_url.get(item['link'])
+                        if existing is None or existing[0] < article_date:
+                            results_by_url[item['link']] = (article_date, record)
                         site_articles += 1
                         total_articles += 1
                         
@@ -94,24 +474,184 @@ class RSSScaper(BaseScraper):
                         continue
 
                 self.logger.info(f"{site['name']}から {site_articles} 件の関連記事を見つけました")
-                time.sleep(self.config.get('settings', {}).get('retry_delay', 2))
 
             except Exception as e:
                 self.logger.error(f"予期せぬエラー ({site['url']}): {e}")
                 continue
 
-        # 重複を除去して日付順にソート
-        unique_results = []
-        seen_urls = set()
-        for result in sorted(self.results, key=lambda x: x['掲載日'], reverse=True):
-            if result['URL'] not in seen_urls:
-                unique_results.append(result)
-                seen_urls.add(result['URL'])
-        
-        self.results = unique_results
+        self._save_feed_cache()
+
+        # 日付順にソート
+        self.results = [
+            record for _, record in
+            sorted(results_by_url.values(), key=itemgetter(0), reverse=True)
+        ]
         self.logger.info(f"\n合計 {len(self.results)} 件の記事が見つかりました")
         return self.results
 
+    def _fetch_all_threaded(self, rss_sites: List[Dict]) -> Iterator[Tuple[Dict, List[Dict]]]:
+        """
+        スレッドプールで全サイトのフィードを取得・パース
+        
+        Args:
+            rss_sites (List[Dict]): 対象サイトの設定
+            
+        Yields:
+            Tuple[Dict, List[Dict]]: 設定の順に (サイト設定, パースされた記事のリスト)
+        """
+        # ワーカースレッドで共有するセッションとキャッシュは開始前に用意しておく
+        self._get_session()
+        self._get_feed_cache()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(site, executor.submit(self._fetch_and_parse, site)) for site in rss_sites]
+
+            # 重複URLのサイト名や同じ日時の記事の並びが実行ごとに変わらないよう、
+            # 完了順ではなく設定の順に結果を返す
+            for site, future in futures:
+                try:
+                    yield future.result()
+                except Exception as e:
+                    self.logger.error(f"予期せぬエラー ({site['url']}): {e}")
+
+    def _fetch_all_multiprocess(self, rss_sites: List[Dict], start_date: datetime,
+                                end_date: datetime, keyword_pattern: Optional[Pattern[str]]
+                                ) -> Iterator[Tuple[Dict, List[Tuple[datetime, Dict]]]]:
+        """
+        スレッドでフィードを取得し、パースとフィルタリングをプロセスプールで実行
+        
+        大きなフィードのパース（CPU処理）を複数コアで並列化する
+        
+        Args:
+            rss_sites (List[Dict]): 対象サイトの設定
+            start_date (datetime): 検索開始日
+            end_date (datetime): 検索終了日
+            keyword_pattern (Optional[Pattern[str]]): キーワードの正規表現
+            
+        Yields:
+            Tuple[Dict, List[Tuple[datetime, Dict]]]: (サイト設定, 条件に一致した (掲載日時, 記事) のリスト)
+        """
+        self._get_session()
+        self._get_feed_cache()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            contents = list(executor.map(self._fetch_site_content, rss_sites))
+
+        fetched = [(site, content) for site, content in zip(rss_sites, contents) if content]
+        if not fetched:
+            return
+
+        # フィード数より多いプロセスは起動しない
+        max_processes = min(os.cpu_count() or 1, len(fetched))
+        with ProcessPoolExecutor(max_workers=max_processes) as process_executor:
+            futures = []
+            for site, content in fetched:
+                # 設定に不備のあるサイトは、他のパス同様そのサイトだけを飛ばす
+                try:
+                    futures.append((site, process_executor.submit(
+                        _parse_and_filter_bytes,
+                        (content, site['scraping_rules'], start_date, end_date, keyword_pattern)
+                    )))
+                except Exception as e:
+                    self.logger.error(f"予期せぬエラー ({site['url']}): {e}")
+                    
+            # 結果は設定の順に返す（_fetch_all_threaded と同様）
+            for site, future in futures:
+                try:
+                    yield site, future.result()
+                except Exception as e:
+                    self.logger.error(f"予期せぬエラー ({site['url']}): {e}")
+
+    def _fetch_site_content(self, site: Dict) -> Optional[bytes]:
+        """
+        サイトのフィードを取得（ワーカースレッドで実行）
+        
+        Args:
+            site (Dict): サイト設定
+            
+        Returns:
+            Optional[bytes]: フィードの内容
+        """
+        self.logger.info(f"\n{site['name']} からの記事を取得中...")
+        try:
+            return self._get_feed_content(site['url'])
+        except Exception as e:
+            self.logger.error(f"予期せぬエラー ({site['url']}): {e}")
+            return None
+
+    async def _fetch_all_async(self, rss_sites: List[Dict]) -> List[Tuple[Dict, List[Dict]]]:
+        """
+        asyncio + aiohttp で全サイトのフィードを取得・パース
+        
+        パース処理（CPU処理）はイベントループを塞がないようスレッドで実行する
+        
+        Args:
+            rss_sites (List[Dict]): 対象サイトの設定
+            
+        Returns:
+            List[Tuple[Dict, List[Dict]]]: (サイト設定, パースされた記事のリスト) のリスト
+        """
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(
+            limit=self.max_workers,
+            limit_per_host=4,
+            ssl=False
+        )
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+        self._get_feed_cache()
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=self.headers) as session:
+            tasks = [self._fetch_and_parse_async(session, site) for site in rss_sites]
+            raw_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        site_feeds = []
+        for site, result in zip(rss_sites, raw_results):
+            # CancelledError は Exception ではないため BaseException で判定する
+            if isinstance(result, BaseException):
+                self.logger.error(f"予期せぬエラー ({site['url']}): {result!r}")
+                continue
+            site_feeds.append(result)
+        return site_feeds
+
+    async def _fetch_and_parse_async(self, session: 'aiohttp.ClientSession',
+                                     site: Dict) -> Tuple[Dict, List[Dict]]:
+        """
+        サイトのフィードを非同期で取得してパース
+        
+        Args:
+            session (aiohttp.ClientSession): HTTPセッション
+            site (Dict): サイト設定
+            
+        Returns:
+            Tuple[Dict, List[Dict]]: (サイト設定, パースされた記事のリスト)
+        """
+        self.logger.info(f"\n{site['name']} からの記事を取得中...")
+        content = await self._get_feed_content_async(session, site['url'])
+        if not content:
+            return site, []
+
+        loop = asyncio.get_running_loop()
+        items = await loop.run_in_executor(None, self._parse_feed, content, site['scraping_rules'])
+        return site, items
+
+    def _fetch_and_parse(self, site: Dict) -> Tuple[Dict, List[Dict]]:
+        """
+        サイトのフィードを取得してパース（ワーカースレッドで実行）
+        
+        Args:
+            site (Dict): サイト設定
+            
+        Returns:
+            Tuple[Dict, List[Dict]]: (サイト設定, パースされた記事のリスト)
+        """
+        content = self._fetch_site_content(site)
+        if not content:
+            return site, []
+
+        return site, self._parse_feed(content, site['scraping_rules'])
+
     def _get_feed_content(self, url: str) -> Optional[bytes]:
         """
         フィードの内容を取得
@@ -122,26 +662,102 @@ class RSSScaper(BaseScraper):
         Returns:
             Optional[bytes]: フィードの内容
         """
-        retry_count = self.config.get('settings', {}).get('retry_count', 3)
-        timeout = self.config.get('settings', {}).get('request_timeout', 30)
-        
-        for i in range(retry_count):
+        session = self._get_session()
+        cached = self._get_feed_cache().get(url)
+        headers = self._conditional_headers(cached)
+
+        for i in range(self.retry_count):
             try:
-                response = requests.get(
+                self._wait_for_host(url)
+                response = session.get(
                     url,
-                    headers=self.headers,
-                    timeout=timeout,
+                    headers=headers,
+                    timeout=self.request_timeout,
                     verify=False
                 )
+                if response.status_code == 304 and cached:
+                    # 更新なし: 前回取得した内容を使用
+                    return cached['content']
+
                 response.raise_for_status()
+                self._update_feed_cache(url, response.headers, response.content)
                 return response.content
             except Exception as e:
-                self.logger.warning(f"フィード取得エラー (試行 {i+1}/{retry_count}): {e}")
-                if i < retry_count - 1:
-                    time.sleep(self.config.get('settings', {}).get('retry_delay', 2))
+                # 再試行までの待機は _wait_for_host が行う
+                self.logger.warning(f"フィード取得エラー (試行 {i+1}/{self.retry_count}): {e}")
                 continue
         return None
 
+    async def _get_feed_content_async(self, session: 'aiohttp.ClientSession',
+                                      url: str) -> Optional[bytes]:
+        """
+        フィードの内容を非同期で取得
+        
+        Args:
+            session (aiohttp.ClientSession): HTTPセッション
+            url (str): フィードのURL
+            
+        Returns:
+            Optional[bytes]: フィードの内容
+        """
+        cached = self._get_feed_cache().get(url)
+        headers = self._conditional_headers(cached)
+
+        for i in range(self.retry_count):
+            try:
+                await self._wait_for_host_async(url)
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304 and cached:
+                        # 更新なし: 前回取得した内容を使用
+                        return cached['content']
+
+                    response.raise_for_status()
+                    content = await response.read()
+                    self._update_feed_cache(url, response.headers, content)
+                    return content
+            except Exception as e:
+                # 再試行までの待機は _wait_for_host_async が行う
+                self.logger.warning(f"フィード取得エラー (試行 {i+1}/{self.retry_count}): {e}")
+                continue
+        return None
+
+    def _conditional_headers(self, cached: Optional[Dict]) -> Dict[str, str]:
+        """
+        条件付きGET用のリクエストヘッダーを作成
+        
+        Args:
+            cached (Optional[Dict]): キャッシュ済みのエントリ
+            
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since ヘッダー
+        """
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
+    def _update_feed_cache(self, url: str, response_headers, content: bytes):
+        """
+        レスポンスにETag / Last-Modified があればキャッシュを更新
+        
+        Args:
+            url (str): フィードのURL
+            response_headers: レスポンスヘッダー
+            content (bytes): フィードの内容
+        """
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if etag or last_modified:
+            self._get_feed_cache()[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'content': content
+            }
+            self._feed_cache_dirty = True
+
     def _parse_feed(self, content: bytes, rules: Dict) -> List[Dict]:
         """
         フィードをパース
@@ -153,35 +769,7 @@ class RSSScaper(BaseScraper):
         Returns:
             List[Dict]: パースされた記事のリスト
         """
-        if not content:
-            return []
-
-        try:
-            soup = BeautifulSoup(content, 'html.parser')
-            items = []
-            
-            for item in soup.find_all(rules.get('article_selector', 'item')):
-                try:
-                    title = item.find(rules.get('title_selector', 'title'))
-                    link = item.find(rules.get('link_selector', 'link'))
-                    date = item.find(rules.get('date_selector', 'pubDate'))
-                    
-                    if title and link:
-                        items.append({
-                            'title': title.get_text(strip=True),
-                            'link': link.get('href') or link.get_text(strip=True),
-                            'date': date.get_text(strip=True) if date else ''
-                        })
-                        
-                except Exception as e:
-                    self.logger.warning(f"記事のパース中にエラー: {e}")
-                    continue
-                    
-            return items
-            
-        except Exception as e:
-            self.logger.error(f"フィードのパース中にエラー: {e}")
-            return []
+        return _parse_feed_items(content, rules, self.logger)
 
     def _validate_article(self, article: Dict) -> bool:
         """
@@ -199,22 +787,23 @@ class RSSScaper(BaseScraper):
             self.validate_url(article['link'])
         ])
 
-    def _keyword_matches(self, text: str, keyword: str) -> bool:
+    def _compile_keywords(self, keyword: str) -> Optional[Pattern[str]]:
         """
-        キーワードマッチング
+        検索キーワードをAND検索用の正規表現にコンパイル
         
         Args:
-            text (str): 検索対象のテキスト
-            keyword (str): 検索キーワード
+            keyword (str): 検索キーワード（空白区切りで複数指定可）
             
         Returns:
-            bool: キーワードが一致する場合True
+            Optional[Pattern[str]]: コンパイルされた正規表現。キーワードが空の場合None
         """
-        if not text or not keyword:
-            return False
+        keywords = keyword.split() if keyword else []
+        if not keywords:
+            return None
             
-        # キーワードを空白で分割し、すべての単語が含まれているかチェック
-        keywords = keyword.lower().split()
-        text_lower = text.lower()
-        
-        return all(kw in text_lower for kw in keywords)
\ No newline at end of file
+        if len(keywords) == 1:
+            return re.compile(re.escape(keywords[0]), re.IGNORECASE)
+            
+        # 先読みを連結し、すべての単語が含まれているかを1回のマッチで判定
+        lookaheads = ''.join(f'(?=.*{re.escape(kw)})' for kw in keywords)
+        return re.compile(rf'\A{lookaheads}', re.IGNORECASE | re.DOTALL)
\ No newline at end of file
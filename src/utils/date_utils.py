@@ -1,9 +1,42 @@
 from datetime import datetime, timedelta
 from typing import Optional, Union
 import logging
-from dateutil import parser
+import functools
 import re
 
+# 対応する日付形式（YYYY-MM-DD, YYYY/MM/DD, YYYY.MM.DD, YYYY年MM月DD日）
+_DATE_FORMAT_RE = re.compile(
+    r'^(?:\d{4}-\d{2}-\d{2}'
+    r'|\d{4}/\d{2}/\d{2}'
+    r'|\d{4}\.\d{2}\.\d{2}'
+    r'|\d{4}年\d{2}月\d{2}日)$'
+)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """
+    絶対日付の文字列をパース（結果をキャッシュ）
+    
+    フィードでは同じ日付文字列が繰り返し現れるため、
+    dateutilによるパースは文字列ごとに一度だけ行う
+    
+    Args:
+        date_str (str): 日付文字列
+        
+    Returns:
+        Optional[datetime]: パースされた日付。失敗時はNone
+    """
+    # dateutilは読み込みが重いため、初回のパース時にインポートする
+    from dateutil import parser
+
+    try:
+        # 一般的な日付形式のパース
+        date = parser.parse(date_str, fuzzy=True)
+        return date.replace(tzinfo=None)
+    except Exception as e:
+        logging.getLogger('DateUtils').warning(f"日付のパースに失敗: {date_str} - {e}")
+        return None
+
 class DateUtils:
     """日付処理ユーティリティクラス"""
     
@@ -47,18 +80,16 @@ class DateUtils:
         if not date_str:
             return None
             
-        # 相対日付の処理
+        date_str = date_str.strip()
+        if not date_str:
+            return None
+            
+        # 相対日付の処理（現在時刻に依存するためキャッシュしない）
         relative_date = self._parse_relative_date(date_str.lower())
         if relative_date:
             return relative_date
             
-        try:
-            # 一般的な日付形式のパース
-            date = parser.parse(date_str, fuzzy=True)
-            return date.replace(tzinfo=None)
-        except Exception as e:
-            self.logger.warning(f"日付のパースに失敗: {date_str} - {e}")
-            return None
+        return _parse_date_cached(date_str)
 
     def _parse_relative_date(self, date_str: str) -> Optional[datetime]:
         """
@@ -159,14 +190,7 @@ class DateUtils:
         Returns:
             bool: 有効な形式の場合True
         """
-        patterns = [
-            r'^\d{4}-\d{2}-\d{2}$',  # YYYY-MM-DD
-            r'^\d{4}/\d{2}/\d{2}$',  # YYYY/MM/DD
-            r'^\d{4}\.\d{2}\.\d{2}$',  # YYYY.MM.DD
-            r'^\d{4}年\d{2}月\d{2}日$'  # YYYY年MM月DD日
-        ]
-        
-        return any(re.match(pattern, date_str) for pattern in patterns)
+        return _DATE_FORMAT_RE.match(date_str) is not None
 
     def normalize_date(self, date_str: str) -> str:
         """
@@ -1,49 +1,184 @@
-from typing import List, Dict, Optional
+from typing import ClassVar, Iterator, List, Dict, Optional, Set, Tuple
+import atexit
+import csv
 import os
-import pandas as pd
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 import logging
-import json
-from pathlib import Path
+import logging.handlers
+
+try:
+    import orjson
+except ImportError:
+    # orjsonが無い環境では標準のjsonで書き込む（必要になるまでインポートしない）
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    # zstandardが無い環境では古いファイルの圧縮を行わない
+    zstandard = None
+
+# CSVの先頭に付けるUTF-8のBOM
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+# 生データ書き込み時のフラグ（Windowsではテキスト変換を避けるためO_BINARYも付ける）
+_RAW_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# 検索結果の表示に使う項目と区切り線
+_ARTICLE_FIELDS = itemgetter('サイト名', '掲載日', 'タイトル', 'URL')
+_SEP = "-" * 50
+
+# 初期化済みのロガー名 -> 設定したハンドラ（外部で設定済みのロガーはNone）
+# 複数スレッドから生成されてもロガーごとに一度だけ設定する
+_LOG_INIT_LOCK = threading.Lock()
+_LOG_INIT: Dict[str, Optional[logging.Handler]] = {}
+
+def _logging_needs_setup(name: str, queued: bool) -> bool:
+    """
+    ロガーにハンドラの設定が必要か判定
+    
+    Args:
+        name (str): ロガー名
+        queued (bool): キュー経由の書き出しを要求する場合True
+        
+    Returns:
+        bool: 未設定、またはキュー無しのハンドラをキュー経由に切り替える必要がある場合True
+    """
+    if name not in _LOG_INIT:
+        return True
+    handler = _LOG_INIT[name]
+    return queued and handler is not None and not isinstance(handler, logging.handlers.QueueHandler)
+
+# 直近に生成したタイムスタンプ（秒, 文字列）
+_ts_cache = (-1, '')
+
+def _fast_timestamp() -> str:
+    """
+    ファイル名用のタイムスタンプ（YYYYmmdd_HHMMSS）を取得
+    
+    同じ秒の間は前回フォーマットした文字列を再利用する
+    
+    Returns:
+        str: タイムスタンプ文字列
+    """
+    global _ts_cache
+    now = int(time.time())
+    cached_second, cached_str = _ts_cache
+    if now == cached_second:
+        return cached_str
+    timestamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(now))
+    _ts_cache = (now, timestamp)
+    return timestamp
+
+class _BufferWriter:
+    """csv.writer の出力をUTF-8でエンコードしてbytearrayに追記するライター"""
+    
+    __slots__ = ('write',)
+    
+    def __init__(self, buf: bytearray):
+        extend = buf.extend
+        self.write = lambda text: extend(text.encode('utf-8'))
 
 class OutputManager:
     """出力管理クラス"""
     
-    def __init__(self, base_output_dir: str = 'output'):
+    # このプロセスで作成済みの出力ディレクトリ
+    _dirs_created: ClassVar[Set[str]] = set()
+    
+    def __init__(self, base_output_dir: str = 'output', queued_logging: bool = False):
         """
         出力管理クラスの初期化
         
         Args:
             base_output_dir (str): 基本出力ディレクトリ
+            queued_logging (bool): ログの書き出しをバックグラウンドスレッドで行う場合True
         """
         self.base_output_dir = base_output_dir
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._setup_logging()
-        self._ensure_output_dir()
+        self._setup_logging(queued_logging)
+        # 出力ディレクトリは最初に書き込むときに作成する
+        self._dirs_ready = False
 
-    def _setup_logging(self):
-        """ロギングの設定"""
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
+    def _setup_logging(self, queued: bool = False):
+        """
+        ロギングの設定
+        
+        Args:
+            queued (bool): Trueの場合、ログの書き出しをバックグラウンドスレッドで行う
+        """
+        name = self.logger.name
+        if not _logging_needs_setup(name, queued):
+            return
+        with _LOG_INIT_LOCK:
+            if not _logging_needs_setup(name, queued):
+                return
+            if name in _LOG_INIT:
+                # キュー無しで設定済みのハンドラをキュー経由のものに置き換える
+                self.logger.removeHandler(_LOG_INIT[name])
+            elif self.logger.handlers:
+                # 外部で設定済みのロガーはそのまま使う
+                _LOG_INIT[name] = None
+                return
+            _LOG_INIT[name] = self._install_log_handler(queued)
+
+    def _install_log_handler(self, queued: bool) -> logging.Handler:
+        """
+        ロガーにハンドラを設定
+        
+        Args:
+            queued (bool): Trueの場合、ログの書き出しをバックグラウンドスレッドで行う
+            
+        Returns:
+            logging.Handler: 追加したハンドラ
+        """
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        handler.setFormatter(formatter)
+        if queued:
+            # 保存処理が標準エラー出力への書き込みを待たないよう、
+            # キュー経由でリスナースレッドに書き出しを任せる
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, handler)
+            listener.start()
+            atexit.register(listener.stop)
+            handler = logging.handlers.QueueHandler(log_queue)
+        self.logger.addHandler(handler)
+        self.logger.setLevel(logging.INFO)
+        return handler
+
+    def _ensure_output_dir_lazy(self):
+        """出力ディレクトリが未作成の場合のみ作成"""
+        if self._dirs_ready:
+            return
+        self._ensure_output_dir()
+        self._dirs_ready = True
 
     def _ensure_output_dir(self):
         """出力ディレクトリの作成"""
         today = datetime.now().strftime('%Y-%m-%d')
         self.output_dir = os.path.join(self.base_output_dir, today)
-        os.makedirs(self.output_dir, exist_ok=True)
+        # 保存時に毎回 os.path.join しないよう、出力先のパスを先に組み立てておく
+        self._sep = os.sep
+        self._raw_dir = os.path.join(self.output_dir, 'raw')
+        self._processed_dir = os.path.join(self.output_dir, 'processed')
+        if self.output_dir in OutputManager._dirs_created:
+            return
         
-        # サブディレクトリの作成
+        # サブディレクトリの作成（親ディレクトリも同時に作成される）
         for subdir in ['raw', 'processed', 'logs']:
             os.makedirs(os.path.join(self.output_dir, subdir), exist_ok=True)
+        OutputManager._dirs_created.add(self.output_dir)
 
     def save_results(self, results: List[Dict], keyword: str,
-                    format: str = 'csv') -> Optional[str]:
+                    format: str = 'csv', pretty: bool = False) -> Optional[str]:
         """
         検索結果を保存
         
@@ -51,6 +186,7 @@ class OutputManager:
             results (List[Dict]): 保存する検索結果
             keyword (str): 検索キーワード
             format (str): 出力形式（'csv' または 'json'）
+            pretty (bool): JSONをインデント付きで出力する場合True
             
         Returns:
             Optional[str]: 保存したファイルのパス
@@ -59,22 +195,184 @@ class OutputManager:
             self.logger.warning("保存する結果がありません")
             return None
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = _fast_timestamp()
         filename = f'news_{timestamp}_{keyword}'
         
         try:
             if format.lower() == 'csv':
                 return self._save_to_csv(results, filename)
             elif format.lower() == 'json':
-                return self._save_to_json(results, filename)
+                return self._save_to_json(results, filename, pretty)
             else:
-                self.logger.error(f"未対応の出力形式: {format}")
+                self.logger.error("未対応の出力形式: %s", format)
                 return None
                 
         except Exception as e:
-            self.logger.error(f"結果の保存に失敗: {e}")
+            self.logger.error("結果の保存に失敗: %s", e)
             return None
 
+    def save_results_many(self, batches: List[Tuple[List[Dict], str]],
+                          format: str = 'csv', pretty: bool = False) -> List[Optional[str]]:
+        """
+        複数キーワードの検索結果をまとめて保存
+        
+        すべてのファイルの内容を先にメモリ上で作成してから、
+        ファイルごとに1回の書き込みで出力する
+        
+        Args:
+            batches (List[Tuple[List[Dict], str]]): (検索結果, 検索キーワード) のリスト
+            format (str): 出力形式（'csv' または 'json'）
+            pretty (bool): JSONをインデント付きで出力する場合True
+            
+        Returns:
+            List[Optional[str]]: 保存したファイルのパス（入力と同じ順序、失敗時はNone）
+        """
+        format = format.lower()
+        if format not in ('csv', 'json'):
+            self.logger.error("未対応の出力形式: %s", format)
+            return [None] * len(batches)
+
+        try:
+            self._ensure_output_dir_lazy()
+        except Exception as e:
+            self.logger.error("出力ディレクトリの作成に失敗: %s", e)
+            return [None] * len(batches)
+
+        # 全ファイルで同じタイムスタンプを使うため、同じキーワードが
+        # 複数あるとファイル名が重なる。重複分には連番を付けて上書きを防ぐ
+        keywords = self._dedupe_keywords([keyword for _, keyword in batches])
+        timestamp = _fast_timestamp()
+        jobs = []
+        for (results, _), keyword in zip(batches, keywords):
+            if not results:
+                self.logger.warning("保存する結果がありません: %s", keyword)
+                jobs.append(None)
+                continue
+            try:
+                filepath = f'{self._processed_dir}{self._sep}news_{timestamp}_{keyword}.{format}'
+                jobs.append((filepath, self._serialize_results(results, format, pretty)))
+            except Exception as e:
+                self.logger.error("結果のシリアライズに失敗 (%s): %s", keyword, e)
+                jobs.append(None)
+
+        saved_paths = []
+        for job in jobs:
+            if job is None:
+                saved_paths.append(None)
+                continue
+            filepath, data = job
+            try:
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+                self.logger.info("結果を保存しました: %s", filepath)
+                saved_paths.append(filepath)
+            except Exception as e:
+                self.logger.error("結果の保存に失敗: %s - %s", filepath, e)
+                saved_paths.append(None)
+        return saved_paths
+
+    def save_results_many_parallel(self, batches: List[Tuple[List[Dict], str]],
+                                   format: str = 'csv', pretty: bool = False,
+                                   max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """
+        複数キーワードの検索結果をスレッドプールで並列に保存
+        
+        各結果は別々のファイルに書き込まれるため、ファイルI/Oの待ち時間を重ねられる
+        
+        Args:
+            batches (List[Tuple[List[Dict], str]]): (検索結果, 検索キーワード) のリスト
+            format (str): 出力形式（'csv' または 'json'）
+            pretty (bool): JSONをインデント付きで出力する場合True
+            max_workers (Optional[int]): 最大スレッド数（省略時は最大8）
+            
+        Returns:
+            List[Optional[str]]: 保存したファイルのパス（入力と同じ順序、失敗時はNone）
+        """
+        if not batches:
+            return []
+        if max_workers is None:
+            max_workers = min(8, len(batches))
+        # 同じキーワードのファイルを並列に同じパスへ書き込まないよう、重複分には連番を付ける
+        keywords = self._dedupe_keywords([keyword for _, keyword in batches])
+            
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda job: self.save_results(job[0], job[1], format, pretty),
+                zip((results for results, _ in batches), keywords)
+            ))
+
+    def _dedupe_keywords(self, keywords: List[str]) -> List[str]:
+        """
+        バッチ内で重複するキーワードの2回目以降に '_2', '_3' ... を付ける
+        
+        Args:
+            keywords (List[str]): バッチのキーワード
+            
+        Returns:
+            List[str]: ファイル名に使うキーワード（入力と同じ順序）
+        """
+        used = set(keywords)
+        seen = set()
+        labels = []
+        for keyword in keywords:
+            label = keyword
+            if keyword in seen:
+                n = 2
+                while f'{keyword}_{n}' in used:
+                    n += 1
+                label = f'{keyword}_{n}'
+                used.add(label)
+                self.logger.warning("キーワードが重複しているため別名で保存します: %s -> %s", keyword, label)
+            seen.add(keyword)
+            labels.append(label)
+        return labels
+
+    def _serialize_results(self, results: List[Dict], format: str,
+                           pretty: bool = False) -> bytes:
+        """
+        検索結果を指定形式のバイト列に変換
+        
+        Args:
+            results (List[Dict]): 変換する結果
+            format (str): 出力形式（'csv' または 'json'）
+            pretty (bool): JSONをインデント付きで出力する場合True
+            
+        Returns:
+            bytes: ファイルに書き込む内容
+        """
+        if format == 'csv':
+            buf = bytearray()
+            self._write_csv_into(buf, results)
+            return buf
+            
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            return orjson.dumps(results, option=option)
+        import json
+        return json.dumps(results, ensure_ascii=False,
+                          indent=2 if pretty else None).encode('utf-8')
+
+    def _write_csv_into(self, buf: bytearray, results: List[Dict]):
+        """
+        検索結果をCSV形式でバッファに書き込む
+        
+        Args:
+            buf (bytearray): 書き込み先のバッファ
+            results (List[Dict]): 変換する結果
+        """
+        # Excelで文字化けしないようBOMを先頭に付け、本文は素のutf-8でエンコードする
+        buf += _UTF8_BOM
+        # 全記事が同じキーを持つため、列の並びを一度だけ決めて
+        # itemgetter でタプル化した行を csv.writer にまとめて渡す
+        fieldnames = list(results[0].keys())
+        writer = csv.writer(_BufferWriter(buf))
+        writer.writerow(fieldnames)
+        if len(fieldnames) == 1:
+            key = fieldnames[0]
+            writer.writerows((row[key],) for row in results)
+        else:
+            writer.writerows(map(itemgetter(*fieldnames), results))
+
     def _save_to_csv(self, results: List[Dict], base_filename: str) -> Optional[str]:
         """
         結果をCSVファイルに保存
@@ -87,38 +385,46 @@ class OutputManager:
             Optional[str]: 保存したファイルのパス
         """
         try:
-            filepath = os.path.join(self.output_dir, 'processed', f'{base_filename}.csv')
-            df = pd.DataFrame(results)
-            df.to_csv(filepath, index=False, encoding='utf-8-sig')
+            self._ensure_output_dir_lazy()
+            filepath = f'{self._processed_dir}{self._sep}{base_filename}.csv'
+            data = self._serialize_results(results, 'csv')
+            with open(filepath, 'wb') as f:
+                f.write(data)
             
-            self.logger.info(f"結果をCSVファイルに保存しました: {filepath}")
+            self.logger.info("結果をCSVファイルに保存しました: %s", filepath)
             return filepath
             
         except Exception as e:
-            self.logger.error(f"CSVファイルの保存に失敗: {e}")
+            self.logger.error("CSVファイルの保存に失敗: %s", e)
             return None
 
-    def _save_to_json(self, results: List[Dict], base_filename: str) -> Optional[str]:
+    def _save_to_json(self, results: List[Dict], base_filename: str,
+                      pretty: bool = False) -> Optional[str]:
         """
         結果をJSONファイルに保存
         
+        シリアライズ結果をメモリ上で作成し、1回の書き込みで出力する
+        
         Args:
             results (List[Dict]): 保存する結果
             base_filename (str): ベースファイル名
+            pretty (bool): インデント付きで出力する場合True
             
         Returns:
             Optional[str]: 保存したファイルのパス
         """
         try:
-            filepath = os.path.join(self.output_dir, 'processed', f'{base_filename}.json')
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            self._ensure_output_dir_lazy()
+            filepath = f'{self._processed_dir}{self._sep}{base_filename}.json'
+            data = self._serialize_results(results, 'json', pretty)
+            with open(filepath, 'wb') as f:
+                f.write(data)
                 
-            self.logger.info(f"結果をJSONファイルに保存しました: {filepath}")
+            self.logger.info("結果をJSONファイルに保存しました: %s", filepath)
             return filepath
             
         except Exception as e:
-            self.logger.error(f"JSONファイルの保存に失敗: {e}")
+            self.logger.error("JSONファイルの保存に失敗: %s", e)
             return None
 
     def save_raw_data(self, data: str, source: str) -> Optional[str]:
@@ -132,19 +438,34 @@ class OutputManager:
         Returns:
             Optional[str]: 保存したファイルのパス
         """
+        if not data:
+            self.logger.debug("保存する生データが空です")
+            return None
+            
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'raw_{timestamp}_{source}.txt'
-            filepath = os.path.join(self.output_dir, 'raw', filename)
+            self._ensure_output_dir_lazy()
+            timestamp = _fast_timestamp()
+            filepath = f'{self._raw_dir}{self._sep}raw_{timestamp}_{source}.txt'
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(data)
+            # 生データは書き込んだ後に読み返さないため、
+            # ディスクへ書き出した後でページキャッシュから外すよう通知する
+            encoded = memoryview(data.encode('utf-8'))
+            fd = os.open(filepath, _RAW_OPEN_FLAGS, 0o644)
+            try:
+                while encoded:
+                    written = os.write(fd, encoded)
+                    encoded = encoded[written:]
+                if hasattr(os, 'posix_fadvise'):
+                    os.fdatasync(fd)
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
                 
-            self.logger.info(f"生データを保存しました: {filepath}")
+            self.logger.info("生データを保存しました: %s", filepath)
             return filepath
             
         except Exception as e:
-            self.logger.error(f"生データの保存に失敗: {e}")
+            self.logger.error("生データの保存に失敗: %s", e)
             return None
 
     def print_results(self, results: List[Dict]):
@@ -158,38 +479,119 @@ class OutputManager:
             print("\n検索結果が見つかりませんでした。")
             return
 
-        print(f"\n合計記事数: {len(results)}")
-        print("\n=== 検索結果 ===")
-        
+        # 出力をまとめて組み立て、1回の書き込みで表示する
+        parts = [f"\n合計記事数: {len(results)}\n\n=== 検索結果 ===\n"]
+        append = parts.append
         for i, article in enumerate(results, 1):
-            print(f"\n記事 {i}:")
-            print(f"サイト名: {article['サイト名']}")
-            print(f"掲載日: {article['掲載日']}")
-            print(f"タイトル: {article['タイトル']}")
-            print(f"URL: {article['URL']}")
-            print("-" * 50)
+            name, date, title, url = _ARTICLE_FIELDS(article)
+            append(
+                f"\n記事 {i}:\n"
+                f"サイト名: {name}\n"
+                f"掲載日: {date}\n"
+                f"タイトル: {title}\n"
+                f"URL: {url}\n"
+                f"{_SEP}\n"
+            )
+        
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
 
-    def cleanup_old_files(self, days: int = 30):
+    def cleanup_old_files(self, days: int = 30, compress_after_days: Optional[int] = 7):
         """
-        古いファイルを削除
+        古いファイルを圧縮・削除
+        
+        compress_after_days を超えたファイルはzstdで圧縮し、
+        days を超えたファイルは削除する
         
         Args:
             days (int): 保持する日数
+            compress_after_days (Optional[int]): 圧縮するまでの日数（Noneの場合は圧縮しない）
         """
         try:
-            current = datetime.now()
-            base_path = Path(self.base_output_dir)
+            current = time.time()
+            if not os.path.isdir(self.base_output_dir):
+                return
+                
+            compressor = None
+            if compress_after_days is not None and compress_after_days < days:
+                if zstandard is not None:
+                    compressor = zstandard.ZstdCompressor(level=3)
+                else:
+                    self.logger.debug("zstandardが無いため古いファイルの圧縮を省略します")
+            
+            # 日付ディレクトリ配下のファイルが対象
+            with os.scandir(self.base_output_dir) as day_entries:
+                day_dirs = [entry.path for entry in day_entries if entry.is_dir(follow_symlinks=False)]
             
-            for path in base_path.glob('*/*'):
-                if not path.is_file():
+            for entry in (e for day_dir in day_dirs for e in self._iter_output_files(day_dir)):
+                try:
+                    # DirEntry.stat() はWindowsでは走査時の情報を再利用するが、
+                    # POSIXではエントリごとに1回statが発生する（結果はキャッシュされる）
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                except FileNotFoundError:
                     continue
                     
-                file_time = datetime.fromtimestamp(path.stat().st_mtime)
-                age = (current - file_time).days
-                
+                age = int((current - mtime) // 86400)
                 if age > days:
-                    path.unlink()
-                    self.logger.info(f"古いファイルを削除しました: {path}")
+                    os.unlink(entry.path)
+                    self.logger.info("古いファイルを削除しました: %s", entry.path)
+                elif (compressor is not None and age > compress_after_days
+                      and not entry.name.endswith('.zst')):
+                    self._compress_file(entry.path, mtime, compressor)
                     
         except Exception as e:
-            self.logger.error(f"ファイルのクリーンアップに失敗: {e}")
\ No newline at end of file
+            self.logger.error("ファイルのクリーンアップに失敗: %s", e)
+
+    def _compress_file(self, path: str, mtime: float, compressor: 'zstandard.ZstdCompressor') -> bool:
+        """
+        ファイルをzstdで圧縮し、元のファイルを削除
+        
+        圧縮後のファイルには元の更新日時を引き継ぎ、削除までの日数を変えない
+        
+        Args:
+            path (str): 圧縮するファイルのパス
+            mtime (float): 元ファイルの更新日時
+            compressor (zstandard.ZstdCompressor): 使用する圧縮器
+            
+        Returns:
+            bool: 圧縮に成功した場合True
+        """
+        compressed_path = f'{path}.zst'
+        try:
+            with open(path, 'rb') as src, open(compressed_path, 'wb') as dst:
+                compressor.copy_stream(src, dst)
+            os.utime(compressed_path, (mtime, mtime))
+            os.unlink(path)
+            self.logger.info("古いファイルを圧縮しました: %s", compressed_path)
+            return True
+            
+        except Exception as e:
+            self.logger.error("ファイルの圧縮に失敗: %s - %s", path, e)
+            # 書きかけの圧縮ファイルは残さない
+            try:
+                os.unlink(compressed_path)
+            except OSError:
+                pass
+            return False
+
+    def _iter_output_files(self, path: str) -> Iterator[os.DirEntry]:
+        """
+        出力ディレクトリ配下のファイルを再帰的に列挙
+        
+        Args:
+            path (str): 走査するディレクトリ
+            
+        Yields:
+            os.DirEntry: ファイルのエントリ
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            return
+            
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._iter_output_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
\ No newline at end of file
@@ -0,0 +1,67 @@
+import logging
+
+from src.scrapers.rss import _parse_feed_items
+
+RULES = {
+    'article_selector': 'item',
+    'title_selector': 'title',
+    'link_selector': 'link',
+    'date_selector': 'pubDate',
+}
+
+logger = logging.getLogger(__name__)
+
+def test_namespaced_siblings_are_not_matched():
+    """プレフィックス無しのセレクタが media:title や atom:link に一致しないこと"""
+    content = b'''<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/" xmlns:atom="http://www.w3.org/2005/Atom">
+<channel>
+<item>
+<media:title>MEDIA</media:title>
+<atom:link href="https://example.com/atom" rel="self"/>
+<title>AI news</title>
+<link>https://example.com/article</link>
+<pubDate>Mon, 01 Jan 2024 10:00:00 +0900</pubDate>
+</item>
+</channel>
+</rss>'''
+    items = _parse_feed_items(content, RULES, logger)
+    assert items == [{
+        'title': 'AI news',
+        'link': 'https://example.com/article',
+        'date': 'Mon, 01 Jan 2024 10:00:00 +0900',
+    }]
+
+def test_prefixed_selector_matches_namespaced_element():
+    """'dc:date' のようなプレフィックス付きセレクタで名前空間付き要素を取得できること"""
+    content = b'''<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns="http://purl.org/rss/1.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<item rdf:about="https://example.com/rdf">
+<title>RDF title</title>
+<link>https://example.com/rdf</link>
+<dc:date>2024-01-01T10:00:00+09:00</dc:date>
+</item>
+</rdf:RDF>'''
+    items = _parse_feed_items(content, dict(RULES, date_selector='dc:date'), logger)
+    assert items == [{
+        'title': 'RDF title',
+        'link': 'https://example.com/rdf',
+        'date': '2024-01-01T10:00:00+09:00',
+    }]
+
+def test_atom_default_namespace_entries():
+    """Atomのデフォルト名前空間の entry/link[href] を記事として扱えること"""
+    content = b'''<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<entry>
+<title>Atom title</title>
+<link href="https://example.com/atom-entry"/>
+<updated>2024-01-01T10:00:00+09:00</updated>
+</entry>
+</feed>'''
+    items = _parse_feed_items(content, dict(RULES, date_selector='updated'), logger)
+    assert items == [{
+        'title': 'Atom title',
+        'link': 'https://example.com/atom-entry',
+        'date': '2024-01-01T10:00:00+09:00',
+    }]
\ No newline at end of file